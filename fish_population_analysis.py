@@ -1,13 +1,24 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import argparse
+import csv
+import hashlib
+import json
 import logging
+import os
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Optional, List, Dict, Union
 import yaml
 from datetime import datetime
 import numpy as np
+import numba
+from numba import njit, prange
 
 # Set up logging
 logging.basicConfig(
@@ -20,6 +31,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _yearly_stats(values: np.ndarray, rows: np.ndarray, with_sumsq: bool) -> tuple:
+    """
+    Compute per-year sum, sum of squares and count over selected rows.
+    
+    Args:
+        values (np.ndarray): Matrix of shape (n_rows, n_years)
+        rows (np.ndarray): Positions of the rows to aggregate
+        with_sumsq (bool): Whether to accumulate sums of squares (left at 0 otherwise)
+        
+    Returns:
+        tuple: float64 sums, float64 sums of squares and int64 counts per year
+    """
+    n_years = values.shape[1]
+    sums = np.zeros(n_years, dtype=np.float64)
+    sumsq = np.zeros(n_years, dtype=np.float64)
+    counts = np.zeros(n_years, dtype=np.int64)
+    for j in prange(n_years):
+        total = 0.0
+        total_sq = 0.0
+        if with_sumsq:
+            for i in rows:
+                x = np.float64(values[i, j])
+                total += x
+                total_sq += x * x
+        else:
+            for i in rows:
+                total += np.float64(values[i, j])
+        sums[j] = total
+        sumsq[j] = total_sq
+        counts[j] = len(rows)
+    return sums, sumsq, counts
+
+def _init_batch_worker() -> None:
+    """Limit each batch worker to one Numba thread so workers do not oversubscribe the CPUs."""
+    numba.set_num_threads(1)
+
+def _shared_yearly_stats(shm_name: str, shape: tuple, dtype: str,
+                         rows: np.ndarray, first: int, last: int,
+                         with_sumsq: bool) -> tuple:
+    """
+    Run _yearly_stats in a worker process on a year matrix in shared memory.
+    
+    Args:
+        shm_name (str): Name of the shared memory block holding the matrix
+        shape (tuple): Shape of the column-major year matrix
+        dtype (str): NumPy dtype string of the matrix
+        rows (np.ndarray): Positions of the rows to aggregate
+        first (int): First year column to aggregate
+        last (int): Year column to stop before
+        with_sumsq (bool): Whether to accumulate sums of squares
+        
+    Returns:
+        tuple: float64 sums, float64 sums of squares and int64 counts per year
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        values = np.ndarray(shape, dtype=dtype, buffer=shm.buf, order='F')
+        stats = _yearly_stats(values[:, first:last], rows, with_sumsq)
+        del values
+        return stats
+    finally:
+        shm.close()
+
 class FishPopulationAnalyzer:
     """A class to analyze and visualize fish population trends."""
     
@@ -28,6 +103,12 @@ class FishPopulationAnalyzer:
         self.config = self._load_config(config_path)
         self.data = None
         self.processed_data = None
+        self.year_cols = []
+        self._years = np.array([], dtype=np.int16)
+        self._year_values = None
+        self._species_rows = {}
+        self._fig = None
+        self._ax = None
         
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
@@ -51,15 +132,129 @@ class FishPopulationAnalyzer:
                 }
             }
 
-    def load_data(self, file_path: str) -> None:
+    @staticmethod
+    def _year_column_mask(columns: pd.Index) -> np.ndarray:
+        """Return a boolean mask of the year (four-digit) column names."""
+        return np.asarray(columns.str.match(r'^\d{4}$'), dtype=bool)
+
+    @staticmethod
+    def _skip_citation_row(row: pacsv.InvalidRow) -> str:
+        """Skip the one-field citation line ending FAO exports; fail on other malformed rows."""
+        return 'skip' if row.actual_columns == 1 else 'error'
+
+    @staticmethod
+    def _is_fresh_conversion(csv_path: Path, parquet_path: Path, markers: bytes) -> bool:
+        """Return whether parquet_path is newer than csv_path and used the same markers."""
+        if not parquet_path.exists() or parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+            return False
+        try:
+            metadata = pq.read_schema(parquet_path).metadata or {}
+        except (OSError, pa.ArrowException):
+            return False
+        return metadata.get(b'missing_value_markers') == markers
+
+    def _to_parquet(self, csv_path: str) -> Union[Path, pa.Table]:
+        """
+        Convert the raw CSV export to Parquet, reusing an existing conversion.
+        
+        The Parquet file is written next to the CSV and is regenerated when
+        the CSV is newer than it or was converted with different missing value
+        markers. If it cannot be written (e.g. the data
+        directory is read-only) the parsed table is returned instead.
+        
+        Args:
+            csv_path (str): Path to the CSV file containing fish population data
+            
+        Returns:
+            Path or pa.Table: Path to the Parquet file, or the in-memory table
+        """
+        csv_path = Path(csv_path)
+        parquet_path = csv_path.with_suffix('.parquet')
+        markers = json.dumps(self.config['missing_value_markers']).encode()
+        if self._is_fresh_conversion(csv_path, parquet_path, markers):
+            return parquet_path
+        
+        with open(csv_path, newline='') as file:
+            header = pd.Index(next(csv.reader(file)))
+        
+        # Parse with a fixed schema: dictionary-encoded ids, float32 years and
+        # missing value markers read as nulls
+        column_types = {col: pa.float32() for col in header[self._year_column_mask(header)]}
+        for col in ['Country (Country)', 'ASFIS species (ASFIS species)',
+                    'FAO major fishing area (FAO major fishing area)']:
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+        convert_options = pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=self.config['missing_value_markers'],
+            strings_can_be_null=True
+        )
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+        
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=read_options,
+            parse_options=pacsv.ParseOptions(invalid_row_handler=self._skip_citation_row),
+            convert_options=convert_options
+        )
+        table = table.replace_schema_metadata({b'missing_value_markers': markers})
+        try:
+            pq.write_table(table, parquet_path, row_group_size=200_000,
+                           compression='zstd', use_dictionary=True)
+        except OSError as e:
+            logger.warning(f"Could not write {parquet_path}, using the parsed CSV in memory: {str(e)}")
+            return table
+        logger.info(f"Converted {csv_path} to {parquet_path}")
+        return parquet_path
+
+    def load_data(self, file_path: str,
+                  species: Optional[Union[str, List[str]]] = None,
+                  country: Optional[str] = None,
+                  start_year: Optional[int] = None,
+                  end_year: Optional[int] = None) -> None:
         """
         Load and validate the fish population dataset.
         
+        Flag columns and years outside the requested range are never read, and
+        species/country filters are pushed down to the Parquet reader.
+        
         Args:
-            file_path (str): Path to the CSV file containing fish population data
+            file_path (str): Path to the CSV (or Parquet) file containing fish population data
+            species (str or List[str], optional): Only load rows for these species codes
+            country (str, optional): Only load rows for this country
+            start_year (int, optional): First year to load (defaults to config start_year)
+            end_year (int, optional): Last year to load (defaults to config end_year)
         """
         try:
-            self.data = pd.read_csv(file_path)
+            if Path(file_path).suffix == '.parquet':
+                source = Path(file_path)
+            else:
+                source = self._to_parquet(file_path)
+            
+            start_year = start_year or self.config['start_year']
+            end_year = end_year or self.config['end_year']
+            schema = source.schema if isinstance(source, pa.Table) else pq.read_schema(source)
+            names = pd.Index(schema.names)
+            is_year = self._year_column_mask(names)
+            years = pd.to_numeric(names.where(is_year), errors='coerce')
+            keep = ~names.str.startswith('S') & (
+                ~is_year | ((years >= start_year) & (years <= end_year))
+            )
+            columns = names[keep].tolist()
+            
+            filters = []
+            if species:
+                species = [species] if isinstance(species, str) else list(species)
+                filters.append(('ASFIS species (ASFIS species)', 'in', species))
+            if country:
+                filters.append(('Country (Country)', '==', country))
+            
+            if isinstance(source, pa.Table):
+                table = source.select(columns)
+                if filters:
+                    table = table.filter(pq.filters_to_expression(filters))
+            else:
+                table = pq.read_table(source, columns=columns, filters=filters or None)
+            self.data = table.to_pandas()
             logger.info(f"Successfully loaded data from {file_path}")
             self._validate_data()
         except Exception as e:
@@ -79,36 +274,168 @@ class FishPopulationAnalyzer:
         """Clean and preprocess the data."""
         try:
             # Drop flag columns
-            flag_columns = [col for col in self.data.columns if col.startswith('S')]
-            self.data = self.data.drop(columns=flag_columns)
+            self.data = self.data.loc[:, ~self.data.columns.str.startswith('S')]
+            
+            # Keep the wide layout: one row per series, one column per year
+            self.year_cols = sorted(self.data.columns[self._year_column_mask(self.data.columns)])
             
-            # Replace missing values
-            for marker in self.config['missing_value_markers']:
-                self.data = self.data.replace(marker, 0)
+            # The typed CSV reader already turns missing value markers into
+            # nulls, so year columns arrive numeric; only columns still holding
+            # text (e.g. from a Parquet file written elsewhere) are coerced.
+            year_data = self.data[self.year_cols]
+            text_cols = year_data.select_dtypes(exclude='number').columns
+            if len(text_cols) > 0:
+                year_data = year_data.copy()
+                year_data[text_cols] = year_data[text_cols].apply(pd.to_numeric, errors="coerce")
             
-            # Convert to long format
-            self.processed_data = pd.melt(
-                self.data,
-                id_vars=["Country (Country)", "ASFIS species (ASFIS species)", 
-                        "FAO major fishing area (FAO major fishing area)"],
-                var_name="Year",
-                value_name="Population"
+            # Nulls become 0 while converting. Tonnes fit comfortably in float32,
+            # which halves the memory traffic of every aggregation. The matrix
+            # is kept column-major as a single block so the aggregation kernel
+            # can use it without another copy.
+            self._year_values = np.asfortranarray(year_data.to_numpy(np.float32, na_value=0))
+            self.processed_data = pd.DataFrame(
+                self._year_values, index=self.data.index,
+                columns=self.year_cols, copy=False
             )
             
-            # Clean up column names and data types
-            self.processed_data.columns = ["Country", "Species", "Fishing_Area", "Year", "Population"]
-            self.processed_data["Year"] = pd.to_numeric(self.processed_data["Year"], errors="coerce")
-            self.processed_data["Population"] = pd.to_numeric(self.processed_data["Population"], errors="coerce")
+            # Id columns become categoricals so filters compare small integer
+            # codes instead of strings
+            for position, (source, col) in enumerate([
+                ("Country (Country)", "Country"),
+                ("ASFIS species (ASFIS species)", "Species"),
+                ("FAO major fishing area (FAO major fishing area)", "Fishing_Area")
+            ]):
+                self.processed_data.insert(position, col, self.data[source].astype("category"))
+            
+            # Everything later steps need now lives in processed_data, so the
+            # raw table is released rather than kept alongside it
+            self.data = None
+            self._index_processed_data()
             
             logger.info("Data cleaning completed successfully")
         except Exception as e:
             logger.error(f"Error during data cleaning: {str(e)}")
             raise
 
+    def _index_processed_data(self) -> None:
+        """Build the lookup structures analyze_species relies on from year_cols."""
+        self._years = np.array(self.year_cols, dtype=np.int16)
+        self._build_species_index()
+
+    def _cache_path(self, file_path: str, cache_dir: str, **filters) -> Path:
+        """
+        Return the cache file for cleaned data from file_path.
+        
+        The file name starts with a hash of the input path, so every cache
+        file for one input can be found, followed by a key covering the
+        first 64 KiB and modification time of the input file, the filters
+        it was loaded with and the configured missing value markers.
+        
+        Args:
+            file_path (str): Path to the input data file
+            cache_dir (str): Directory holding cached cleaned data
+            **filters: Filters passed on to load_data
+            
+        Returns:
+            Path: Path of the cache file
+        """
+        source = hashlib.blake2b(str(Path(file_path).resolve()).encode()).hexdigest()[:8]
+        with open(file_path, 'rb') as file:
+            head = file.read(1 << 16)
+        key = hashlib.blake2b(
+            head
+            + str(os.path.getmtime(file_path)).encode()
+            + repr(sorted(filters.items())).encode()
+            + json.dumps(self.config['missing_value_markers']).encode()
+        ).hexdigest()[:16]
+        return Path(cache_dir) / f"cache_{source}_{key}.parquet"
+
+    def prepare_data(self, file_path: str,
+                     cache_dir: Optional[str] = None,
+                     species: Optional[Union[str, List[str]]] = None,
+                     country: Optional[str] = None,
+                     start_year: Optional[int] = None,
+                     end_year: Optional[int] = None) -> None:
+        """
+        Load and clean the dataset, reusing cleaned data cached on disk.
+        
+        Args:
+            file_path (str): Path to the CSV (or Parquet) file containing fish population data
+            cache_dir (str, optional): Cache directory (defaults to a cache
+                subdirectory of config output_dir)
+            species (str or List[str], optional): Only load rows for these species codes
+            country (str, optional): Only load rows for this country
+            start_year (int, optional): First year to load (defaults to config start_year)
+            end_year (int, optional): Last year to load (defaults to config end_year)
+        """
+        if species and not isinstance(species, str):
+            # Order does not change the loaded rows, so it must not change the key
+            species = sorted(species)
+        filters = {
+            'species': species,
+            'country': country,
+            'start_year': start_year or self.config['start_year'],
+            'end_year': end_year or self.config['end_year']
+        }
+        cache_dir = cache_dir or str(Path(self.config['output_dir']) / 'cache')
+        cache_path = self._cache_path(file_path, cache_dir, **filters)
+        
+        if cache_path.exists():
+            try:
+                self.processed_data = pq.read_table(cache_path).to_pandas()
+                columns = self.processed_data.columns
+                self.year_cols = sorted(columns[self._year_column_mask(columns)])
+                # Column-major year matrix for the aggregation kernel
+                self._year_values = np.asfortranarray(
+                    self.processed_data[self.year_cols].to_numpy(np.float32)
+                )
+                self._index_processed_data()
+                logger.info(f"Loaded cleaned data from cache {cache_path}")
+                return
+            except (OSError, pa.ArrowException) as e:
+                logger.warning(f"Discarding unreadable cache file {cache_path}: {str(e)}")
+                cache_path.unlink(missing_ok=True)
+        
+        self.load_data(file_path, **filters)
+        self.clean_data()
+        
+        # Write to a temporary file first so an interrupted run never leaves
+        # a partial cache file behind
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.Table.from_pandas(self.processed_data, preserve_index=False),
+                           temp_path, compression='zstd', row_group_size=500_000)
+            os.replace(temp_path, cache_path)
+            logger.info(f"Cached cleaned data to {cache_path}")
+            
+            # Keep one cache file per input: drop those for other filters or
+            # for an older version of the file
+            source = cache_path.name.split('_')[1]
+            for stale_path in cache_path.parent.glob(f"cache_{source}_*.parquet"):
+                if stale_path != cache_path:
+                    stale_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {cache_path}: {str(e)}")
+            temp_path.unlink(missing_ok=True)
+
+    def _build_species_index(self) -> None:
+        """Precompute the row positions of every species for O(1) lookups."""
+        species = self.processed_data["Species"]
+        codes = species.cat.codes.to_numpy()
+        order = np.argsort(codes, kind='stable')
+        # Rows with a missing species have code -1 and sort before bounds[0]
+        bounds = np.searchsorted(codes[order], np.arange(len(species.cat.categories) + 1))
+        self._species_rows = {
+            category: order[bounds[i]:bounds[i + 1]]
+            for i, category in enumerate(species.cat.categories)
+        }
+
     def analyze_species(self, species: Optional[str] = None, 
                        country: Optional[str] = None,
                        start_year: Optional[int] = None,
-                       end_year: Optional[int] = None) -> pd.DataFrame:
+                       end_year: Optional[int] = None,
+                       with_ci: bool = False) -> pd.DataFrame:
         """
         Analyze population trends for a specific species and/or country.
         
@@ -117,6 +444,7 @@ class FishPopulationAnalyzer:
             country (str, optional): Country to analyze
             start_year (int, optional): Start year for analysis
             end_year (int, optional): End year for analysis
+            with_ci (bool): Whether to add std and 95% confidence interval (ci95) columns
             
         Returns:
             pd.DataFrame: Analyzed data
@@ -124,24 +452,146 @@ class FishPopulationAnalyzer:
         if self.processed_data is None:
             raise ValueError("No processed data available. Run clean_data() first.")
             
-        filtered_data = self.processed_data.copy()
+        rows = self._select_rows(species, country)
+        first, last = self._year_range(start_year, end_year)
+        if len(rows) == 0:
+            first = last = 0
+        
+        # Aggregate each year column in one pass: mean and std are derived
+        # from the sum and sum of squares, which is only accumulated when
+        # the confidence interval is requested
+        sums, sumsq, counts = _yearly_stats(self._year_values[:, first:last], rows, with_ci)
+        return self._summarize(self._years[first:last], sums, sumsq, counts, with_ci)
+
+    def analyze_species_batch(self, species_list: List[str],
+                              country: Optional[str] = None,
+                              start_year: Optional[int] = None,
+                              end_year: Optional[int] = None,
+                              with_ci: bool = False,
+                              max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Analyze population trends for several species in parallel.
+        
+        The year matrix is placed in shared memory once and each worker
+        process aggregates the rows of one species from it.
         
-        # Apply filters
+        Args:
+            species_list (List[str]): Species codes to analyze
+            country (str, optional): Country to analyze
+            start_year (int, optional): Start year for analysis
+            end_year (int, optional): End year for analysis
+            with_ci (bool): Whether to add std and 95% confidence interval (ci95) columns
+            max_workers (int, optional): Number of worker processes
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Analyzed data for each species
+        """
+        if self.processed_data is None:
+            raise ValueError("No processed data available. Run clean_data() first.")
+        
+        first, last = self._year_range(start_year, end_year)
+        # Species without matching rows get an empty year range, as in analyze_species
+        selections = {}
+        for species in species_list:
+            rows = self._select_rows(species, country)
+            selections[species] = (rows, first, last if len(rows) else first)
+        
+        values = self._year_values
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, order='F')[:] = values
+            # Spawned workers: forking after Numba's thread pool has started is unsafe
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_batch_worker) as executor:
+                futures = {
+                    species: executor.submit(_shared_yearly_stats, shm.name, values.shape,
+                                             values.dtype.str, rows, start, stop, with_ci)
+                    for species, (rows, start, stop) in selections.items()
+                }
+                results = {
+                    species: self._summarize(self._years[start:stop],
+                                             *futures[species].result(), with_ci)
+                    for species, (rows, start, stop) in selections.items()
+                }
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        return results
+
+    def _select_rows(self, species: Optional[str], country: Optional[str]) -> np.ndarray:
+        """Return the row positions matching the species and country filters."""
         if species:
-            filtered_data = filtered_data[filtered_data["Species"] == species]
+            rows = self._species_rows.get(species, np.array([], dtype=np.intp))
+        else:
+            rows = np.arange(len(self.processed_data))
         if country:
-            filtered_data = filtered_data[filtered_data["Country"] == country]
-        if start_year:
-            filtered_data = filtered_data[filtered_data["Year"] >= start_year]
-        if end_year:
-            filtered_data = filtered_data[filtered_data["Year"] <= end_year]
-            
-        # Group and aggregate data
-        grouped_data = filtered_data.groupby("Year")["Population"].agg([
-            'sum', 'mean', 'std', 'count'
-        ]).reset_index()
+            # Only the candidate rows are compared, not the whole column
+            rows = rows[self._category_mask(self.processed_data["Country"], country, rows)]
+        return rows
+
+    def _year_range(self, start_year: Optional[int], end_year: Optional[int]) -> tuple:
+        """Return the [first, last) year column positions for the year filters."""
+        first = np.searchsorted(self._years, start_year) if start_year else 0
+        last = (np.searchsorted(self._years, end_year, side='right')
+                if end_year else len(self._years))
+        return first, last
+
+    @staticmethod
+    def _summarize(years: np.ndarray, sums: np.ndarray, sumsq: np.ndarray,
+                   counts: np.ndarray, with_ci: bool) -> pd.DataFrame:
+        """Assemble the per-year result frame from the kernel's reductions."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+            summary = pd.DataFrame({
+                "Year": years,
+                "sum": sums,
+                "mean": means,
+                "count": counts
+            })
+            if with_ci:
+                variances = (sumsq - counts * means ** 2) / (counts - 1)
+                summary["std"] = np.sqrt(np.maximum(variances, 0))
+                summary["ci95"] = 1.96 * summary["std"] / np.sqrt(counts)
         
-        return grouped_data
+        return summary
+
+    @staticmethod
+    def _category_mask(column: pd.Series, value: str,
+                       rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a boolean mask of rows (or all rows) whose category equals value."""
+        codes = column.cat.codes.to_numpy()
+        if rows is not None:
+            codes = codes[rows]
+        categories = column.cat.categories
+        if value not in categories:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == categories.get_loc(value)
+
+    def _trend_axes(self) -> tuple:
+        """Return the reusable trend figure and axes, creating them on first use."""
+        if self._fig is None:
+            # Imported on first plot so analysis/export runs skip loading
+            # matplotlib. Plots are only ever saved, so the figure is drawn
+            # on an Agg canvas directly, leaving the process-wide backend
+            # of a host application untouched.
+            import matplotlib
+            import matplotlib.style
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            # Use basic style instead of seaborn. The figure is built without
+            # pyplot so it is never registered with (and kept alive by)
+            # pyplot's figure manager.
+            with matplotlib.style.context('default'):
+                self._fig = Figure(figsize=self.config['plot_style']['figure_size'])
+                FigureCanvasAgg(self._fig)
+                self._ax = self._fig.add_subplot()
+                self._ax.set_xlabel("Year")
+                self._ax.set_ylabel("Population (Tonnes)")
+                self._ax.grid(self.config['plot_style']['grid'])
+        return self._fig, self._ax
 
     def plot_trends(self, analyzed_data: pd.DataFrame, 
                    species: str, 
@@ -156,46 +606,95 @@ class FishPopulationAnalyzer:
             output_path (str, optional): Path to save the plot
             show_confidence (bool): Whether to show confidence intervals
         """
-        # Use basic style instead of seaborn
-        plt.style.use('default')
-        fig, ax = plt.subplots(figsize=self.config['plot_style']['figure_size'])
-        
-        # Plot main trend line
-        ax.plot(analyzed_data["Year"], analyzed_data["sum"],
-                color=self.config['plot_style']['line_color'],
-                marker=self.config['plot_style']['marker'],
-                label=species)
-        
-        # Add confidence intervals if requested
-        if show_confidence and 'std' in analyzed_data.columns:
-            confidence_interval = 1.96 * analyzed_data['std'] / np.sqrt(analyzed_data['count'])
-            ax.fill_between(analyzed_data["Year"],
-                          analyzed_data["sum"] - confidence_interval,
-                          analyzed_data["sum"] + confidence_interval,
-                          alpha=0.2,
-                          color=self.config['plot_style']['line_color'])
-        
-        # Customize plot
-        ax.set_title(f"Population Trends for {species}")
-        ax.set_xlabel("Year")
-        ax.set_ylabel("Population (Tonnes)")
-        ax.grid(self.config['plot_style']['grid'])
-        ax.legend()
-        
-        # Save plot if output path provided
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Plot saved to {output_path}")
-        
-        plt.close()
+        fig, ax = self._trend_axes()
+        import matplotlib.style
+        
+        # Draw and save under the default style too, so rcParams set by a
+        # host application do not leak into the plot
+        with matplotlib.style.context('default'):
+            # Drop the previous plot's data and reset the data limits
+            for artist in [*ax.lines, *ax.collections]:
+                artist.remove()
+            ax.relim()
+        
+            # Plot main trend line
+            ax.plot(analyzed_data["Year"], analyzed_data["sum"],
+                    color=self.config['plot_style']['line_color'],
+                    marker=self.config['plot_style']['marker'],
+                    label=species)
+        
+            # Add confidence intervals if requested
+            if show_confidence and 'ci95' in analyzed_data.columns:
+                ax.fill_between(analyzed_data["Year"],
+                              analyzed_data["sum"] - analyzed_data["ci95"],
+                              analyzed_data["sum"] + analyzed_data["ci95"],
+                              alpha=0.2,
+                              color=self.config['plot_style']['line_color'])
+        
+            # Customize plot
+            ax.set_title(f"Population Trends for {species}")
+            ax.legend()
+        
+            # Save plot if output path provided
+            if output_path:
+                dpi = self.config.get('export', {}).get('plot_dpi', 150)
+                # Fast, light PNG compression: slightly larger files, much quicker saves
+                fig.savefig(output_path, dpi=dpi, bbox_inches='tight',
+                            pil_kwargs={'compress_level': 1})
+                logger.info(f"Plot saved to {output_path}")
+
+    def _long_table(self) -> pa.Table:
+        """
+        Build the long (one row per series and year) table for export.
+        
+        Columns are assembled already typed instead of melting and parsing
+        the year labels: the column-major year matrix flattens into
+        Population without a copy, Year repeats the int16 years and the id
+        columns reuse their category codes as dictionary indices.
+        
+        Returns:
+            pa.Table: Long-format table
+        """
+        n_rows = len(self.processed_data)
+        columns = {}
+        for col in ["Country", "Species", "Fishing_Area"]:
+            categories = self.processed_data[col].cat
+            codes = np.tile(categories.codes.to_numpy(), len(self.year_cols))
+            columns[col] = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(categories.categories)
+            )
+        columns["Year"] = pa.array(np.repeat(self._years, n_rows))
+        columns["Population"] = pa.array(self._year_values.ravel(order='F'))
+        return pa.table(columns)
 
     def export_data(self, output_path: str) -> None:
-        """Export processed data to CSV."""
+        """
+        Export processed data in long (one row per year) format.
+        
+        Only the rows and years that were loaded are exported, so data
+        loaded with species, country or year filters is exported filtered.
+        
+        Paths ending in .parquet are written as Parquet with the large
+        Population column first and the small dictionary-encoded id columns
+        grouped at the end; anything else is written as CSV.
+        
+        Args:
+            output_path (str): Path of the exported file
+        """
         if self.processed_data is None:
             raise ValueError("No processed data available to export")
             
         try:
-            self.processed_data.to_csv(output_path, index=False)
+            table = self._long_table()
+            if Path(output_path).suffix == '.parquet':
+                table = table.select(["Population", "Year", "Species", "Country", "Fishing_Area"])
+                pq.write_table(table, output_path, row_group_size=500_000,
+                               compression='zstd', use_dictionary=True,
+                               write_statistics=True)
+            else:
+                table.select(
+                    ["Country", "Species", "Fishing_Area", "Year", "Population"]
+                ).to_pandas().to_csv(output_path, index=False)
             logger.info(f"Data exported successfully to {output_path}")
         except Exception as e:
             logger.error(f"Error exporting data: {str(e)}")
@@ -204,13 +703,15 @@ class FishPopulationAnalyzer:
 def main():
     """Main function to run the analysis tool."""
     parser = argparse.ArgumentParser(description="Fish Population Trend Analysis Tool")
-    parser.add_argument("--input", required=True, help="Path to input CSV file")
+    parser.add_argument("--input", required=True, help="Path to input CSV (or Parquet) file")
     parser.add_argument("--config", default="config.yaml", help="Path to config file")
-    parser.add_argument("--species", help="Species code to analyze")
+    parser.add_argument("--species", nargs="+", help="Species code(s) to analyze")
     parser.add_argument("--country", help="Country to analyze")
     parser.add_argument("--start-year", type=int, help="Start year for analysis")
     parser.add_argument("--end-year", type=int, help="End year for analysis")
     parser.add_argument("--output-dir", default="output", help="Directory for output files")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Analyze several species in worker processes")
     
     args = parser.parse_args()
     
@@ -222,28 +723,48 @@ def main():
     analyzer = FishPopulationAnalyzer(args.config)
     
     try:
-        # Process data
-        analyzer.load_data(args.input)
-        analyzer.clean_data()
-        
-        # Analyze data
-        species = args.species or analyzer.config['default_species']
-        analyzed_data = analyzer.analyze_species(
-            species=species,
+        # Process data; only the requested species, country and years are
+        # loaded, so the export below holds just that subset
+        species_list = args.species or [analyzer.config['default_species']]
+        analyzer.prepare_data(
+            args.input,
+            cache_dir=str(output_dir / 'cache'),
+            species=species_list,
             country=args.country,
             start_year=args.start_year,
             end_year=args.end_year
         )
         
+        # Analyze data; worker processes only pay off for many species, so
+        # they are opt-in
+        if args.parallel and len(species_list) > 1:
+            results = analyzer.analyze_species_batch(
+                species_list,
+                country=args.country,
+                start_year=args.start_year,
+                end_year=args.end_year,
+                with_ci=True
+            )
+        else:
+            results = {species: analyzer.analyze_species(
+                species=species,
+                country=args.country,
+                start_year=args.start_year,
+                end_year=args.end_year,
+                with_ci=True
+            ) for species in species_list}
+        
         # Generate outputs
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Save plot
-        plot_path = output_dir / f"population_trend_{species}_{timestamp}.png"
-        analyzer.plot_trends(analyzed_data, species, str(plot_path))
+        # Save plots
+        for species, analyzed_data in results.items():
+            plot_path = output_dir / f"population_trend_{species}_{timestamp}.png"
+            analyzer.plot_trends(analyzed_data, species, str(plot_path))
         
         # Export processed data
-        data_path = output_dir / f"processed_data_{timestamp}.csv"
+        data_format = analyzer.config.get('export', {}).get('data_format', 'csv')
+        data_path = output_dir / f"processed_data_{timestamp}.{data_format}"
         analyzer.export_data(str(data_path))
         
         logger.info("Analysis completed successfully")